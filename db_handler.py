@@ -1,6 +1,7 @@
 import os
-from typing import List, Optional
-from datetime import datetime
+import asyncio
+from typing import List, Optional, Tuple
+from datetime import datetime, timezone
 from domain_checker import DomainResult
 
 try:
@@ -9,6 +10,9 @@ try:
 except ImportError:
     SUPABASE_AVAILABLE = False
 
+INSERT_CHUNK_SIZE = 500
+MAX_CONCURRENT_INSERTS = 4
+
 class DatabaseHandler:
     def __init__(self):
         self.supabase: Optional[Client] = None
@@ -33,37 +37,34 @@ class DatabaseHandler:
             return None
 
         try:
+            successful = failed = 0
+            for r in results:
+                if r.error:
+                    failed += 1
+                elif r.status_code:
+                    successful += 1
+
+            scan_time = datetime.now()
             scan_data = {
-                'scan_name': scan_name or f"Scan {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                'scan_name': scan_name or f"Scan {scan_time.strftime('%Y-%m-%d %H:%M:%S')}",
                 'total_domains': len(results),
-                'successful': len([r for r in results if r.status_code and not r.error]),
-                'failed': len([r for r in results if r.error]),
-                'created_at': datetime.now().isoformat()
+                'successful': successful,
+                'failed': failed,
+                'created_at': scan_time.astimezone(timezone.utc).isoformat()
             }
 
-            scan_response = self.supabase.table('scans').insert(scan_data).execute()
+            scan_response = await asyncio.to_thread(
+                self.supabase.table('scans').insert(scan_data).execute
+            )
 
             if scan_response.data:
                 scan_id = scan_response.data[0]['id']
 
-                domain_results = []
-                for result in results:
-                    domain_results.append({
-                        'scan_id': scan_id,
-                        'domain': result.domain,
-                        'status_code': result.status_code,
-                        'response_time_ms': round(result.response_time * 1000, 2) if result.response_time else None,
-                        'protocol_used': result.protocol_used,
-                        'server_info': result.server_info,
-                        'has_ssl': bool(result.ssl_info and not result.ssl_info.get('error')),
-                        'redirect_count': len(result.redirect_history),
-                        'error': result.error,
-                        'final_url': result.final_url,
-                        'security_headers': result.security_headers,
-                        'created_at': result.timestamp.isoformat()
-                    })
+                domain_results = [self._result_to_row(result, scan_id) for result in results]
 
-                self.supabase.table('domain_results').insert(domain_results).execute()
+                failed_chunks, total_chunks = await self._insert_in_chunks('domain_results', domain_results)
+                if failed_chunks:
+                    print(f"Warning: {failed_chunks} of {total_chunks} result chunks could not be saved to database")
 
                 return scan_id
 
@@ -71,6 +72,52 @@ class DatabaseHandler:
             print(f"Warning: Could not save to database: {e}")
             return None
 
+    @staticmethod
+    def _result_to_row(result: DomainResult, scan_id: str) -> dict:
+        row = {
+            'scan_id': scan_id,
+            'domain': result.domain,
+            'status_code': result.status_code,
+            'response_time_ms': round(result.response_time * 1000, 2) if result.response_time else None,
+            'protocol_used': result.protocol_used,
+            'server_info': result.server_info,
+            'has_ssl': bool(result.ssl_info and not result.ssl_info.get('error')),
+            'redirect_count': len(result.redirect_history),
+            'error': result.error,
+            'final_url': result.final_url,
+            'security_headers': result.security_headers,
+            'created_at': datetime.fromtimestamp(
+                result.timestamp, tz=timezone.utc
+            ).isoformat(timespec='milliseconds')
+        }
+        # Omitted columns default to NULL, so there is no need to send them
+        return {key: value for key, value in row.items() if value is not None}
+
+    async def _insert_in_chunks(self, table: str, rows: List[dict]) -> Tuple[int, int]:
+        # PostgREST requires every object in a bulk insert to have the same keys
+        groups = {}
+        for row in rows:
+            groups.setdefault(tuple(row), []).append(row)
+
+        chunks = [
+            group[start:start + INSERT_CHUNK_SIZE]
+            for group in groups.values()
+            for start in range(0, len(group), INSERT_CHUNK_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_INSERTS)
+
+        async def insert_chunk(chunk: List[dict]) -> bool:
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(self.supabase.table(table).insert(chunk).execute)
+                    return True
+                except Exception as e:
+                    print(f"Warning: Could not save {len(chunk)} rows to {table}: {e}")
+                    return False
+
+        outcomes = await asyncio.gather(*(insert_chunk(chunk) for chunk in chunks))
+        return outcomes.count(False), len(chunks)
+
     def get_scan_history(self, limit: int = 10):
         if not self.enabled:
             return []
@@ -110,41 +157,50 @@ class DatabaseHandler:
                 'resolved_errors': [],
                 'performance_changes': []
             }
+            add_status_change = changes['status_changes'].append
+            add_new_error = changes['new_errors'].append
+            add_resolved_error = changes['resolved_errors'].append
+            add_performance_change = changes['performance_changes'].append
 
-            for domain in set(domains1.keys()) | set(domains2.keys()):
-                r1 = domains1.get(domain)
+            # Only domains present in both scans can be compared.
+            for domain, r1 in domains1.items():
                 r2 = domains2.get(domain)
+                if not r2:
+                    continue
+
+                status1, status2 = r1['status_code'], r2['status_code']
+                error1, error2 = r1['error'], r2['error']
+                time1, time2 = r1['response_time_ms'], r2['response_time_ms']
+
+                if status1 != status2:
+                    add_status_change({
+                        'domain': domain,
+                        'old_status': status1,
+                        'new_status': status2
+                    })
 
-                if r1 and r2:
-                    if r1['status_code'] != r2['status_code']:
-                        changes['status_changes'].append({
-                            'domain': domain,
-                            'old_status': r1['status_code'],
-                            'new_status': r2['status_code']
-                        })
+                if not error1 and error2:
+                    add_new_error({
+                        'domain': domain,
+                        'error': error2
+                    })
 
-                    if not r1['error'] and r2['error']:
-                        changes['new_errors'].append({
-                            'domain': domain,
-                            'error': r2['error']
-                        })
+                if error1 and not error2:
+                    add_resolved_error({
+                        'domain': domain,
+                        'previous_error': error1
+                    })
 
-                    if r1['error'] and not r2['error']:
-                        changes['resolved_errors'].append({
+                if time1 and time2:
+                    time_diff = time2 - time1
+                    if abs(time_diff) > 100:
+                        add_performance_change({
                             'domain': domain,
-                            'previous_error': r1['error']
+                            'old_time': time1,
+                            'new_time': time2,
+                            'difference': time_diff
                         })
 
-                    if r1['response_time_ms'] and r2['response_time_ms']:
-                        time_diff = r2['response_time_ms'] - r1['response_time_ms']
-                        if abs(time_diff) > 100:
-                            changes['performance_changes'].append({
-                                'domain': domain,
-                                'old_time': r1['response_time_ms'],
-                                'new_time': r2['response_time_ms'],
-                                'difference': time_diff
-                            })
-
             return changes
 
         except Exception as e:
@@ -1,13 +1,58 @@
 import asyncio
+import random
 import aiohttp
 import ssl
-import socket
+import sys
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 import certifi
 
+try:
+    import aiodns
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+SECURITY_HEADERS = {
+    name.lower(): name for name in (
+        'Strict-Transport-Security',
+        'Content-Security-Policy',
+        'X-Frame-Options',
+        'X-Content-Type-Options',
+        'X-XSS-Protection',
+        'Referrer-Policy',
+        'Permissions-Policy'
+    )
+}
+
+# Retrying these over plain HTTP would only repeat the same failure
+NO_FALLBACK_ERROR_TYPES = frozenset({'dns', 'timeout'})
+
+# SSL errors and 'invalid' requests (bad URL, redirect loop) fail the same way every time
+RETRYABLE_ERROR_TYPES = frozenset({'dns', 'timeout', 'connection', 'request'})
+
+# Retried without backoff: these are not rate limiting, so waiting does not help
+NO_BACKOFF_ERROR_TYPES = frozenset({'dns', 'timeout'})
+
+# Servers that reject HEAD are probed again with GET
+HEAD_UNSUPPORTED_STATUSES = frozenset({405, 501})
+
+CSV_FIELDNAMES = (
+    'domain', 'status_code', 'protocol_used', 'response_time_ms',
+    'dns_time_ms', 'connection_time_ms', 'server_info', 'final_url',
+    'redirect_count', 'ssl_valid_until', 'has_hsts', 'has_csp',
+    'error', 'timestamp'
+)
+
 class DomainResult:
+    __slots__ = (
+        'domain', 'status_code', 'headers', 'redirect_history', 'response_time',
+        'dns_time', 'connection_time', 'ssl_info', 'error', 'error_type', 'protocol_used',
+        'server_info', 'security_headers', 'timestamp', 'final_url'
+    )
+
     def __init__(self, domain: str):
         self.domain = domain
         self.status_code = None
@@ -18,17 +63,18 @@ class DomainResult:
         self.connection_time = None
         self.ssl_info = {}
         self.error = None
+        self.error_type = None
         self.protocol_used = None
         self.server_info = None
         self.security_headers = {}
-        self.timestamp = datetime.now()
+        self.timestamp = time.time()
         self.final_url = None
 
     def to_dict(self) -> Dict:
         return {
             'domain': self.domain,
             'status_code': self.status_code,
-            'headers': dict(self.headers) if self.headers else {},
+            'headers': self.headers,
             'redirect_history': self.redirect_history,
             'response_time_ms': round(self.response_time * 1000, 2) if self.response_time else None,
             'dns_time_ms': round(self.dns_time * 1000, 2) if self.dns_time else None,
@@ -38,149 +84,268 @@ class DomainResult:
             'protocol_used': self.protocol_used,
             'server_info': self.server_info,
             'security_headers': self.security_headers,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.isoformat_timestamp(),
             'final_url': self.final_url
         }
 
+    def to_csv_row(self) -> Tuple:
+        security_headers = self.security_headers
+        return (
+            self.domain,
+            self.status_code or 'N/A',
+            self.protocol_used or 'N/A',
+            round(self.response_time * 1000, 2) if self.response_time else 'N/A',
+            round(self.dns_time * 1000, 2) if self.dns_time else 'N/A',
+            round(self.connection_time * 1000, 2) if self.connection_time else 'N/A',
+            self.server_info or 'N/A',
+            self.final_url or 'N/A',
+            len(self.redirect_history),
+            self.ssl_info.get('valid_until', 'N/A'),
+            'Yes' if 'Strict-Transport-Security' in security_headers else 'No',
+            'Yes' if 'Content-Security-Policy' in security_headers else 'No',
+            self.error or 'None',
+            self.isoformat_timestamp()
+        )
+
+    def isoformat_timestamp(self) -> str:
+        return datetime.fromtimestamp(self.timestamp).isoformat()
+
 class DomainChecker:
     def __init__(self, timeout: int = 10, max_retries: int = 2,
-                 user_agent: str = None, verify_ssl: bool = True):
+                 user_agent: str = None, verify_ssl: bool = True,
+                 per_host: int = 8, keep_full_headers: bool = True,
+                 backoff_cap: float = 1.0):
         self.timeout = timeout
         self.max_retries = max_retries
         self.user_agent = user_agent or 'HTTPChecker/2.0 (https://github.com/VanessaEvo/HTTPChecker)'
         self.verify_ssl = verify_ssl
+        self.per_host = per_host
+        self.keep_full_headers = keep_full_headers
+        self.backoff_cap = backoff_cap
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        self._ssl_context = ssl.create_default_context(cafile=certifi.where())
+        if not self.verify_ssl:
+            self._ssl_context.check_hostname = False
+            self._ssl_context.verify_mode = ssl.CERT_NONE
+
+        # Certificate details are only exposed by a verifying context, so
+        # _get_ssl_info keeps its own regardless of verify_ssl.
+        self._cert_info_context = ssl.create_default_context()
+
+    async def __aenter__(self) -> 'DomainChecker':
+        if self._session is None:
+            self._session = self._create_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def check_domain(self, domain: str, semaphore: asyncio.Semaphore) -> DomainResult:
-        async with semaphore:
-            result = DomainResult(domain)
-
-            for attempt in range(self.max_retries + 1):
-                try:
-                    result = await self._check_with_protocol(domain, 'https', result)
-                    if result.error and 'SSL' not in result.error:
-                        result = await self._check_with_protocol(domain, 'http', result)
-                    break
-                except Exception as e:
-                    if attempt == self.max_retries:
-                        result.error = f"Max retries exceeded: {str(e)}"
-                    else:
-                        await asyncio.sleep(2 ** attempt)
-
-            return result
+        if self._session is None:
+            raise RuntimeError("No open session: use 'async with DomainChecker()' or check_domains_batch()")
 
-    async def _check_with_protocol(self, domain: str, protocol: str, result: DomainResult) -> DomainResult:
-        url = f"{protocol}://{domain}"
-        start_time = asyncio.get_event_loop().time()
+        result = DomainResult(domain)
 
-        dns_start = asyncio.get_event_loop().time()
-        try:
-            socket.gethostbyname(domain)
-            result.dns_time = asyncio.get_event_loop().time() - dns_start
-        except socket.gaierror:
-            result.error = "DNS resolution failed"
-            return result
+        for attempt in range(self.max_retries + 1):
+            async with semaphore:
+                result = await self._check_with_protocol(domain, 'https', result)
+                if result.error and result.error_type not in NO_FALLBACK_ERROR_TYPES:
+                    result = await self._check_with_protocol(domain, 'http', result)
 
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        if not self.verify_ssl:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            if result.error_type not in RETRYABLE_ERROR_TYPES or attempt == self.max_retries:
+                break
+            if result.error_type not in NO_BACKOFF_ERROR_TYPES:
+                # Back off outside the semaphore so the slot can serve other domains
+                await asyncio.sleep(min(self.backoff_cap, (2 ** attempt) * random.uniform(0.5, 1.5)))
+
+        return result
 
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        headers = {'User-Agent': self.user_agent}
+    async def _check_with_protocol(self, domain: str, protocol: str, result: DomainResult) -> DomainResult:
+        url = f"{protocol}://{domain}"
+        now = asyncio.get_running_loop().time
+        start_time = now()
 
+        trace_ctx = {}
         try:
-            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                conn_start = asyncio.get_event_loop().time()
-                async with session.get(url, headers=headers, allow_redirects=True) as response:
-                    result.connection_time = asyncio.get_event_loop().time() - conn_start
-                    result.response_time = asyncio.get_event_loop().time() - start_time
-                    result.status_code = response.status
-                    result.headers = dict(response.headers)
-                    result.protocol_used = protocol
-                    result.final_url = str(response.url)
+            conn_start = now()
+            async with await self._fetch(url, trace_ctx) as response:
+                result.connection_time = now() - conn_start
+                result.dns_time = trace_ctx.get('dns_time')
+                result.response_time = now() - start_time
+                result.status_code = response.status
+                result.headers = dict(response.headers) if self.keep_full_headers else {}
+                result.protocol_used = protocol
+                result.final_url = str(response.url)
 
-                    result.redirect_history = []
-                    for redirect in response.history:
-                        result.redirect_history.append({
-                            'status': redirect.status,
-                            'url': str(redirect.url)
-                        })
+                result.redirect_history = []
+                for redirect in response.history:
+                    result.redirect_history.append({
+                        'status': redirect.status,
+                        'url': str(redirect.url)
+                    })
 
-                    result.server_info = response.headers.get('Server', 'Unknown')
+                result.server_info = sys.intern(response.headers.get('Server', 'Unknown'))
 
-                    result.security_headers = self._extract_security_headers(response.headers)
+                result.security_headers = self._extract_security_headers(response.headers)
 
-                    if protocol == 'https':
-                        result.ssl_info = await self._get_ssl_info(domain)
+                if protocol == 'https':
+                    result.ssl_info = await self._get_ssl_info(domain)
 
-                    result.error = None
+                result.error = None
+                result.error_type = None
 
         except aiohttp.ClientSSLError as e:
             result.error = f"SSL error: {str(e)}"
+            result.error_type = 'ssl'
         except aiohttp.ClientConnectorError as e:
-            result.error = f"Connection error: {str(e)}"
+            if trace_ctx.get('dns_pending'):
+                result.error = "DNS resolution failed"
+                result.error_type = 'dns'
+            else:
+                result.error = f"Connection error: {str(e)}"
+                result.error_type = 'connection'
         except asyncio.TimeoutError:
             result.error = "Request timed out"
+            result.error_type = 'timeout'
+        except (aiohttp.ClientResponseError, aiohttp.InvalidURL) as e:
+            result.error = f"Request exception: {str(e)}"
+            result.error_type = 'invalid'
         except Exception as e:
             result.error = f"Request exception: {str(e)}"
+            result.error_type = 'request'
 
         return result
 
+    async def _fetch(self, url: str, trace_ctx: Dict) -> aiohttp.ClientResponse:
+        response = await self._session.head(url, allow_redirects=True, trace_request_ctx=trace_ctx)
+        if response.status in HEAD_UNSUPPORTED_STATUSES:
+            response.release()
+            response = await self._session.get(url, allow_redirects=True, trace_request_ctx=trace_ctx)
+        return response
+
     def _extract_security_headers(self, headers: Dict) -> Dict:
         security_headers = {}
-        important_headers = [
-            'Strict-Transport-Security',
-            'Content-Security-Policy',
-            'X-Frame-Options',
-            'X-Content-Type-Options',
-            'X-XSS-Protection',
-            'Referrer-Policy',
-            'Permissions-Policy'
-        ]
-
-        for header in important_headers:
-            if header in headers:
-                security_headers[header] = headers[header]
+        for key, value in headers.items():
+            name = SECURITY_HEADERS.get(key.lower())
+            if name and name not in security_headers:
+                security_headers[name] = value
 
         return security_headers
 
     async def _get_ssl_info(self, domain: str) -> Dict:
         ssl_info = {}
         try:
-            context = ssl.create_default_context()
-            with socket.create_connection((domain, 443), timeout=5) as sock:
-                with context.wrap_socket(sock, server_hostname=domain) as ssock:
-                    cert = ssock.getpeercert()
-                    ssl_info['version'] = ssock.version()
-                    ssl_info['cipher'] = ssock.cipher()[0] if ssock.cipher() else 'Unknown'
-
-                    if cert:
-                        ssl_info['subject'] = dict(x[0] for x in cert.get('subject', []))
-                        ssl_info['issuer'] = dict(x[0] for x in cert.get('issuer', []))
-                        ssl_info['valid_from'] = cert.get('notBefore', 'Unknown')
-                        ssl_info['valid_until'] = cert.get('notAfter', 'Unknown')
-                        ssl_info['serial_number'] = cert.get('serialNumber', 'Unknown')
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(domain, 443, ssl=self._cert_info_context,
+                                        server_hostname=domain),
+                timeout=5
+            )
+            try:
+                ssock = writer.get_extra_info('ssl_object')
+                cert = ssock.getpeercert()
+                ssl_info['version'] = ssock.version()
+                ssl_info['cipher'] = ssock.cipher()[0] if ssock.cipher() else 'Unknown'
+
+                if cert:
+                    ssl_info['subject'] = dict(x[0] for x in cert.get('subject', []))
+                    ssl_info['issuer'] = dict(x[0] for x in cert.get('issuer', []))
+                    ssl_info['valid_from'] = cert.get('notBefore', 'Unknown')
+                    ssl_info['valid_until'] = cert.get('notAfter', 'Unknown')
+                    ssl_info['serial_number'] = cert.get('serialNumber', 'Unknown')
+            finally:
+                writer.close()
         except Exception as e:
             ssl_info['error'] = str(e)
 
         return ssl_info
 
+    @staticmethod
+    async def _on_dns_resolvehost_start(session, trace_config_ctx, params):
+        ctx = trace_config_ctx.trace_request_ctx
+        if ctx is not None:
+            ctx['dns_pending'] = True
+            ctx['dns_start'] = asyncio.get_running_loop().time()
+
+    @staticmethod
+    async def _on_dns_resolvehost_end(session, trace_config_ctx, params):
+        ctx = trace_config_ctx.trace_request_ctx
+        if ctx is not None and ctx.get('dns_pending'):
+            ctx['dns_pending'] = False
+            ctx.setdefault('dns_time', asyncio.get_running_loop().time() - ctx['dns_start'])
+
+    @staticmethod
+    async def _on_dns_cache_hit(session, trace_config_ctx, params):
+        ctx = trace_config_ctx.trace_request_ctx
+        if ctx is not None:
+            ctx.setdefault('dns_time', 0.0)
+
+    @staticmethod
+    def _create_resolver() -> aiohttp.abc.AbstractResolver:
+        if AIODNS_AVAILABLE:
+            try:
+                return aiohttp.AsyncResolver()
+            except RuntimeError as e:
+                # aiodns needs a SelectorEventLoop on Windows, but asyncio.run uses the Proactor loop there
+                print(f"Warning: async DNS unavailable ({e}); using threaded resolver")
+        return aiohttp.ThreadedResolver()
+
+    def _create_session(self, max_concurrent: int = 100) -> aiohttp.ClientSession:
+        resolver = self._create_resolver()
+        connector = aiohttp.TCPConnector(
+            ssl=self._ssl_context,
+            limit=max_concurrent,
+            limit_per_host=min(self.per_host, max_concurrent),
+            ttl_dns_cache=300,
+            resolver=resolver
+        )
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_dns_resolvehost_start.append(self._on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(self._on_dns_resolvehost_end)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={'User-Agent': self.user_agent},
+            trace_configs=[trace_config],
+            read_bufsize=4096
+        )
+
     async def check_domains_batch(self, domains: List[str],
                                   max_concurrent: int = 10,
                                   progress_callback=None) -> List[DomainResult]:
+        # The connector already caps pooled connections; the semaphore also bounds
+        # the side connections opened by _get_ssl_info and time spent in retries.
         semaphore = asyncio.Semaphore(max_concurrent)
-        tasks = []
+        owns_session = self._session is None
+        if owns_session:
+            self._session = self._create_session(max_concurrent)
+
+        tasks = [asyncio.create_task(self.check_domain(domain, semaphore)) for domain in domains]
+
+        try:
+            if not progress_callback:
+                return list(await asyncio.gather(*tasks))
 
-        for domain in domains:
-            task = self.check_domain(domain, semaphore)
-            tasks.append(task)
+            done_queue = asyncio.Queue()
+            for task in tasks:
+                task.add_done_callback(done_queue.put_nowait)
 
-        results = []
-        for i, task in enumerate(asyncio.as_completed(tasks)):
-            result = await task
-            results.append(result)
-            if progress_callback:
-                progress_callback(i + 1, len(domains), result)
+            results = []
+            for i in range(len(tasks)):
+                result = (await done_queue.get()).result()
+                results.append(result)
+                progress_callback(i + 1, len(tasks), result)
 
-        return results
+            return results
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if owns_session:
+                await self._session.close()
+                self._session = None
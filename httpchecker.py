@@ -1,11 +1,23 @@
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import pyfiglet
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
+# Reuse one pooled session so repeated checks skip the TCP/TLS setup
+session = requests.Session()
+session.headers['User-Agent'] = 'HTTPChecker/1.0 (https://github.com/VanessaEvo/HTTPChecker)'
+adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+session.mount('https://', adapter)
+session.mount('http://', adapter)
+atexit.register(session.close)
+
 def check_domain(domain):
     try:
         # Attempt to get the response from both HTTP and HTTPS
-        response = requests.get(f"https://{domain}", stream=True)
+        response = session.get(f"https://{domain}", stream=True, timeout=10)
+        response.close()  # Only status and headers are used; release the connection
         response.raise_for_status()  # Raise an error for bad responses
     except requests.exceptions.HTTPError as http_err:
         return f"HTTP error occurred: {http_err}", None, None
@@ -36,10 +48,10 @@ with open(domain_list_path, 'r') as file:
 # Prompt the user for the path to save the results
 results_path = input("Enter the path and name of file to save the results: ")
 
-# Open the file to save the results
-with open(results_path, 'w') as results_file:
-    for domain in tqdm(domains, desc="Checking domains"):
-        status_code, headers, redirect_history = check_domain(domain)
+# Check domains in parallel and save the results in input order
+with open(results_path, 'w') as results_file, ThreadPoolExecutor(max_workers=32) as executor:
+    checked = zip(domains, executor.map(check_domain, domains))
+    for domain, (status_code, headers, redirect_history) in tqdm(checked, total=len(domains), desc="Checking domains"):
         results_file.write(f"Domain: {domain}\n")
         results_file.write(f"Status Code: {status_code}\n")
         results_file.write(f"Headers: {headers}\n")
@@ -2,12 +2,15 @@ import asyncio
 import argparse
 import sys
 import os
+import re
 from pathlib import Path
 import pyfiglet
 from domain_checker import DomainChecker
 from reporter import Reporter
 from db_handler import DatabaseHandler
 
+HOST_RE = re.compile(r'^(?:https?://)?([^/?#\s]+)')
+
 def print_banner():
     ascii_banner = pyfiglet.figlet_format("HTTP Checker v2.0")
     print(ascii_banner)
@@ -16,19 +19,20 @@ def print_banner():
     print()
 
 def validate_domain(domain: str) -> str:
-    domain = domain.strip()
-    if domain.startswith('http://') or domain.startswith('https://'):
-        domain = domain.split('://', 1)[1]
-    if '/' in domain:
-        domain = domain.split('/')[0]
-    return domain
+    match = HOST_RE.match(domain.strip())
+    return match.group(1) if match else ''
 
 def load_domains(file_path: str) -> list:
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            domains = [validate_domain(line) for line in f.read().splitlines() if line.strip()]
-            domains = list(set(domains))
-            return domains
+        seen = set()
+        domains = []
+        with open(file_path, 'r', encoding='utf-8', errors='replace', buffering=1 << 20) as f:
+            for line in f:
+                domain = validate_domain(line)
+                if domain and domain not in seen:
+                    seen.add(domain)
+                    domains.append(domain)
+        return domains
     except FileNotFoundError:
         print(f"Error: File '{file_path}' not found.")
         sys.exit(1)
@@ -79,6 +83,9 @@ For more information, visit: https://github.com/VanessaEvo/HTTPChecker
     parser.add_argument('-c', '--concurrent', type=int, default=10,
                        help='Maximum concurrent requests (default: 10)')
 
+    parser.add_argument('--per-host', type=int, default=8,
+                       help='Maximum concurrent connections to a single host (default: 8)')
+
     parser.add_argument('-t', '--timeout', type=int, default=10,
                        help='Request timeout in seconds (default: 10)')
 
@@ -220,6 +227,7 @@ async def main():
 
     print(f"Configuration:")
     print(f"  Concurrent Requests: {args.concurrent}")
+    print(f"  Per-Host Connections: {min(args.per_host, args.concurrent)}")
     print(f"  Timeout: {args.timeout}s")
     print(f"  Max Retries: {args.retries}")
     print(f"  SSL Verification: {'Disabled' if args.no_ssl_verify else 'Enabled'}")
@@ -232,7 +240,9 @@ async def main():
         timeout=args.timeout,
         max_retries=args.retries,
         user_agent=args.user_agent,
-        verify_ssl=not args.no_ssl_verify
+        verify_ssl=not args.no_ssl_verify,
+        per_host=args.per_host,
+        keep_full_headers=args.format in ('text', 'json')
     )
 
     print(f"Starting scan of {len(domains)} domains...")
@@ -249,6 +259,8 @@ async def main():
         print("Scan Complete!")
         print("=" * 80)
 
+    stats = Reporter._calculate_stats(results) if args.output or args.verbose else None
+
     if args.output:
         output_path = args.output
         ext_map = {'json': '.json', 'csv': '.csv', 'html': '.html', 'text': '.txt'}
@@ -258,14 +270,7 @@ async def main():
 
         print(f"\nGenerating {args.format.upper()} report...")
 
-        if args.format == 'json':
-            Reporter.generate_json_report(results, output_path)
-        elif args.format == 'csv':
-            Reporter.generate_csv_report(results, output_path)
-        elif args.format == 'html':
-            Reporter.generate_html_report(results, output_path)
-        else:
-            Reporter.generate_text_report(results, output_path)
+        Reporter.generate_reports(results, {args.format: output_path}, stats)
 
         print(f"Results saved to: {output_path}")
 
@@ -280,7 +285,6 @@ async def main():
             print("Warning: Database is not configured. Results not saved to database.")
 
     if args.verbose:
-        stats = Reporter._calculate_stats(results)
         print("\n" + "=" * 80)
         print("SUMMARY STATISTICS")
         print("=" * 80)
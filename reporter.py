@@ -1,121 +1,31 @@
 import json
 import csv
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from datetime import datetime
-from domain_checker import DomainResult
+from html import escape
+from itertools import islice
+from domain_checker import CSV_FIELDNAMES, DomainResult
 
-class Reporter:
-    @staticmethod
-    def generate_text_report(results: List[DomainResult], file_path: str):
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("="*80 + "\n")
-            f.write("HTTP CHECKER REPORT\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Domains Checked: {len(results)}\n")
-            f.write("="*80 + "\n\n")
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-            stats = Reporter._calculate_stats(results)
-            f.write("SUMMARY STATISTICS\n")
-            f.write("-"*80 + "\n")
-            f.write(f"Success Rate: {stats['success_rate']:.2f}%\n")
-            f.write(f"Average Response Time: {stats['avg_response_time']:.2f}ms\n")
-            f.write(f"Fastest Response: {stats['min_response_time']:.2f}ms\n")
-            f.write(f"Slowest Response: {stats['max_response_time']:.2f}ms\n")
-            f.write(f"Total Errors: {stats['error_count']}\n")
-            f.write(f"Total Redirects: {stats['redirect_count']}\n")
-            f.write(f"HTTPS Success: {stats['https_count']}\n")
-            f.write(f"HTTP Fallback: {stats['http_count']}\n\n")
-
-            f.write("="*80 + "\n")
-            f.write("DETAILED RESULTS\n")
-            f.write("="*80 + "\n\n")
+RULE = "=" * 80
+DIVIDER = "-" * 80
 
-            for result in results:
-                f.write(f"Domain: {result.domain}\n")
-                f.write(f"Status Code: {result.status_code or 'N/A'}\n")
-                f.write(f"Protocol Used: {result.protocol_used or 'N/A'}\n")
-
-                if result.error:
-                    f.write(f"Error: {result.error}\n")
-                else:
-                    f.write(f"Response Time: {result.response_time*1000:.2f}ms\n")
-                    f.write(f"DNS Resolution Time: {result.dns_time*1000:.2f}ms\n" if result.dns_time else "")
-                    f.write(f"Connection Time: {result.connection_time*1000:.2f}ms\n" if result.connection_time else "")
-                    f.write(f"Server: {result.server_info}\n")
-                    f.write(f"Final URL: {result.final_url}\n")
+WRITE_BUFFER_SIZE = 1 << 20
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
 
-                    if result.redirect_history:
-                        f.write(f"Redirects ({len(result.redirect_history)}):\n")
-                        for i, redirect in enumerate(result.redirect_history, 1):
-                            f.write(f"  {i}. [{redirect['status']}] {redirect['url']}\n")
-
-                    if result.ssl_info and not result.ssl_info.get('error'):
-                        f.write("SSL Certificate Info:\n")
-                        f.write(f"  Version: {result.ssl_info.get('version', 'N/A')}\n")
-                        f.write(f"  Cipher: {result.ssl_info.get('cipher', 'N/A')}\n")
-                        f.write(f"  Valid Until: {result.ssl_info.get('valid_until', 'N/A')}\n")
-
-                    if result.security_headers:
-                        f.write("Security Headers:\n")
-                        for header, value in result.security_headers.items():
-                            f.write(f"  {header}: {value}\n")
-
-                    if result.headers:
-                        f.write("Response Headers:\n")
-                        for key, value in list(result.headers.items())[:10]:
-                            f.write(f"  {key}: {value}\n")
-
-                f.write("-"*80 + "\n\n")
-
-    @staticmethod
-    def generate_json_report(results: List[DomainResult], file_path: str):
-        data = {
-            'metadata': {
-                'generated_at': datetime.now().isoformat(),
-                'total_domains': len(results),
-                'statistics': Reporter._calculate_stats(results)
-            },
-            'results': [result.to_dict() for result in results]
-        }
+PROGRESS_BAR_LENGTH = 40
+PROGRESS_MIN_INTERVAL = 1 / 30
+PROGRESS_BAR_FULL = '█' * PROGRESS_BAR_LENGTH
+PROGRESS_BAR_EMPTY = '░' * PROGRESS_BAR_LENGTH
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-    @staticmethod
-    def generate_csv_report(results: List[DomainResult], file_path: str):
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = [
-                'domain', 'status_code', 'protocol_used', 'response_time_ms',
-                'dns_time_ms', 'connection_time_ms', 'server_info', 'final_url',
-                'redirect_count', 'ssl_valid_until', 'has_hsts', 'has_csp',
-                'error', 'timestamp'
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for result in results:
-                writer.writerow({
-                    'domain': result.domain,
-                    'status_code': result.status_code or 'N/A',
-                    'protocol_used': result.protocol_used or 'N/A',
-                    'response_time_ms': round(result.response_time * 1000, 2) if result.response_time else 'N/A',
-                    'dns_time_ms': round(result.dns_time * 1000, 2) if result.dns_time else 'N/A',
-                    'connection_time_ms': round(result.connection_time * 1000, 2) if result.connection_time else 'N/A',
-                    'server_info': result.server_info or 'N/A',
-                    'final_url': result.final_url or 'N/A',
-                    'redirect_count': len(result.redirect_history),
-                    'ssl_valid_until': result.ssl_info.get('valid_until', 'N/A') if result.ssl_info else 'N/A',
-                    'has_hsts': 'Yes' if 'Strict-Transport-Security' in result.security_headers else 'No',
-                    'has_csp': 'Yes' if 'Content-Security-Policy' in result.security_headers else 'No',
-                    'error': result.error or 'None',
-                    'timestamp': result.timestamp.isoformat()
-                })
-
-    @staticmethod
-    def generate_html_report(results: List[DomainResult], file_path: str):
-        stats = Reporter._calculate_stats(results)
-
-        html = f"""<!DOCTYPE html>
+HTML_HEADER_TMPL = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -157,34 +67,34 @@ class Reporter:
     <div class="container">
         <header>
             <h1>HTTP Checker Report</h1>
-            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p>Total Domains: {len(results)}</p>
+            <p>Generated: {generated}</p>
+            <p>Total Domains: {total}</p>
         </header>
 
         <div class="stats">
             <div class="stat-card">
                 <h3>Success Rate</h3>
-                <div class="value">{stats['success_rate']:.1f}%</div>
+                <div class="value">{stats[success_rate]:.1f}%</div>
             </div>
             <div class="stat-card">
                 <h3>Avg Response Time</h3>
-                <div class="value">{stats['avg_response_time']:.0f}ms</div>
+                <div class="value">{stats[avg_response_time]:.0f}ms</div>
             </div>
             <div class="stat-card">
                 <h3>Total Errors</h3>
-                <div class="value">{stats['error_count']}</div>
+                <div class="value">{stats[error_count]}</div>
             </div>
             <div class="stat-card">
                 <h3>HTTPS Success</h3>
-                <div class="value">{stats['https_count']}</div>
+                <div class="value">{stats[https_count]}</div>
             </div>
             <div class="stat-card">
                 <h3>Total Redirects</h3>
-                <div class="value">{stats['redirect_count']}</div>
+                <div class="value">{stats[redirect_count]}</div>
             </div>
             <div class="stat-card">
                 <h3>Fastest Response</h3>
-                <div class="value">{stats['min_response_time']:.0f}ms</div>
+                <div class="value">{stats[min_response_time]:.0f}ms</div>
             </div>
         </div>
 
@@ -210,42 +120,7 @@ class Reporter:
             <tbody>
 """
 
-        for result in results:
-            status_class = 'status-success' if result.status_code and 200 <= result.status_code < 300 else 'status-error'
-            if result.redirect_history:
-                status_class = 'status-redirect'
-
-            row_class = 'error' if result.error else ('redirect' if result.redirect_history else 'success')
-
-            html += f"""
-                <tr class="row-{row_class}">
-                    <td><strong>{result.domain}</strong></td>
-                    <td class="{status_class}">{result.status_code or 'Error'}</td>
-                    <td>"""
-
-            if result.protocol_used:
-                badge_class = 'badge-https' if result.protocol_used == 'https' else 'badge-http'
-                html += f'<span class="badge {badge_class}">{result.protocol_used.upper()}</span>'
-            else:
-                html += 'N/A'
-
-            html += f"""</td>
-                    <td>{round(result.response_time * 1000, 2) if result.response_time else 'N/A'}ms</td>
-                    <td>{result.server_info or 'N/A'}</td>
-                    <td>{len(result.redirect_history) if result.redirect_history else '0'}</td>
-                    <td>"""
-
-            security_badges = []
-            if result.security_headers.get('Strict-Transport-Security'):
-                security_badges.append('HSTS')
-            if result.security_headers.get('Content-Security-Policy'):
-                security_badges.append('CSP')
-
-            html += ', '.join(security_badges) if security_badges else 'None'
-
-            html += "</td></tr>"
-
-        html += """
+HTML_FOOTER = """
             </tbody>
         </table>
     </div>
@@ -273,36 +148,246 @@ class Reporter:
 </html>
 """
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+PROTOCOL_BADGES = {
+    'https': '<span class="badge badge-https">HTTPS</span>',
+    'http': '<span class="badge badge-http">HTTP</span>'
+}
+
+class Reporter:
+    _last_progress_time = 0.0
+
+    @staticmethod
+    def generate_text_report(results: List[DomainResult], file_path: str, stats: Optional[dict] = None):
+        generated = datetime.now().strftime(TIMESTAMP_FORMAT)
+        if stats is None:
+            stats = Reporter._calculate_stats(results)
+
+        with open(file_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            write = f.write
+
+            write(RULE + "\n")
+            write("HTTP CHECKER REPORT\n")
+            write(f"Generated: {generated}\n")
+            write(f"Total Domains Checked: {len(results)}\n")
+            write(RULE + "\n\n")
+
+            write("SUMMARY STATISTICS\n")
+            write(DIVIDER + "\n")
+            write(f"Success Rate: {stats['success_rate']:.2f}%\n")
+            write(f"Average Response Time: {stats['avg_response_time']:.2f}ms\n")
+            write(f"Fastest Response: {stats['min_response_time']:.2f}ms\n")
+            write(f"Slowest Response: {stats['max_response_time']:.2f}ms\n")
+            write(f"Total Errors: {stats['error_count']}\n")
+            write(f"Total Redirects: {stats['redirect_count']}\n")
+            write(f"HTTPS Success: {stats['https_count']}\n")
+            write(f"HTTP Fallback: {stats['http_count']}\n\n")
+
+            write(RULE + "\n")
+            write("DETAILED RESULTS\n")
+            write(RULE + "\n\n")
+
+            for result in results:
+                write(f"Domain: {result.domain}\n")
+                write(f"Status Code: {result.status_code or 'N/A'}\n")
+                write(f"Protocol Used: {result.protocol_used or 'N/A'}\n")
+
+                if result.error:
+                    write(f"Error: {result.error}\n")
+                else:
+                    write(f"Response Time: {result.response_time * 1000:.2f}ms\n")
+                    if result.dns_time:
+                        write(f"DNS Resolution Time: {result.dns_time * 1000:.2f}ms\n")
+                    if result.connection_time:
+                        write(f"Connection Time: {result.connection_time * 1000:.2f}ms\n")
+                    write(f"Server: {result.server_info}\n")
+                    write(f"Final URL: {result.final_url}\n")
+
+                    if result.redirect_history:
+                        write(f"Redirects ({len(result.redirect_history)}):\n")
+                        for i, redirect in enumerate(result.redirect_history, 1):
+                            write(f"  {i}. [{redirect['status']}] {redirect['url']}\n")
+
+                    if result.ssl_info and not result.ssl_info.get('error'):
+                        write("SSL Certificate Info:\n")
+                        write(f"  Version: {result.ssl_info.get('version', 'N/A')}\n")
+                        write(f"  Cipher: {result.ssl_info.get('cipher', 'N/A')}\n")
+                        write(f"  Valid Until: {result.ssl_info.get('valid_until', 'N/A')}\n")
+
+                    if result.security_headers:
+                        write("Security Headers:\n")
+                        for header, value in result.security_headers.items():
+                            write(f"  {header}: {value}\n")
+
+                    if result.headers:
+                        write("Response Headers:\n")
+                        for key, value in islice(result.headers.items(), 10):
+                            write(f"  {key}: {value}\n")
+
+                write(DIVIDER + "\n\n")
+
+    @staticmethod
+    def generate_json_report(results: List[DomainResult], file_path: str, stats: Optional[dict] = None):
+        if stats is None:
+            stats = Reporter._calculate_stats(results)
+
+        data = {
+            'metadata': {
+                'generated_at': datetime.now(),
+                'total_domains': len(results),
+                'statistics': stats
+            },
+            'results': [result.to_dict() for result in results]
+        }
+
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(file_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=datetime.isoformat)
+
+    @staticmethod
+    def generate_csv_report(results: List[DomainResult], file_path: str, stats: Optional[dict] = None):
+        with open(file_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(result.to_csv_row() for result in results)
+
+    @staticmethod
+    def generate_html_report(results: List[DomainResult], file_path: str, stats: Optional[dict] = None):
+        if stats is None:
+            stats = Reporter._calculate_stats(results)
+        generated = datetime.now().strftime(TIMESTAMP_FORMAT)
+
+        # Server banners repeat heavily across domains, so escape each distinct one once
+        escaped_servers = {}
+
+        with open(file_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            write = f.write
+
+            write(HTML_HEADER_TMPL.format(generated=generated, total=len(results), stats=stats))
+
+            for result in results:
+                status_code = result.status_code
+                server_info = result.server_info
+                server_cell = escaped_servers.get(server_info)
+                if server_cell is None:
+                    server_cell = escaped_servers[server_info] = escape(server_info or 'N/A')
+                response_time = result.response_time
+                redirect_count = len(result.redirect_history)
+                security_headers = result.security_headers
+
+                if redirect_count:
+                    status_class = 'status-redirect'
+                elif status_code and 200 <= status_code < 300:
+                    status_class = 'status-success'
+                else:
+                    status_class = 'status-error'
+
+                row_class = 'error' if result.error else ('redirect' if redirect_count else 'success')
+
+                security_badges = []
+                if security_headers.get('Strict-Transport-Security'):
+                    security_badges.append('HSTS')
+                if security_headers.get('Content-Security-Policy'):
+                    security_badges.append('CSP')
+
+                write(f"""
+                <tr class="row-{row_class}">
+                    <td><strong>{escape(result.domain)}</strong></td>
+                    <td class="{status_class}">{status_code or 'Error'}</td>
+                    <td>{PROTOCOL_BADGES.get(result.protocol_used, 'N/A')}</td>
+                    <td>{round(response_time * 1000, 2) if response_time else 'N/A'}ms</td>
+                    <td>{server_cell}</td>
+                    <td>{redirect_count}</td>
+                    <td>{', '.join(security_badges) if security_badges else 'None'}</td></tr>""")
+
+            write(HTML_FOOTER)
+
+    @staticmethod
+    def generate_reports(results: List[DomainResult], paths: Dict[str, str],
+                         stats: Optional[dict] = None):
+        if stats is None:
+            stats = Reporter._calculate_stats(results)
+
+        generators = {
+            'text': Reporter.generate_text_report,
+            'json': Reporter.generate_json_report,
+            'csv': Reporter.generate_csv_report,
+            'html': Reporter.generate_html_report
+        }
+        if len(paths) == 1:
+            (report_format, file_path), = paths.items()
+            generators[report_format](results, file_path, stats)
+            return
+
+        # Generators only read results and stats, so formats can be written side by side
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            futures = [
+                executor.submit(generators[report_format], results, file_path, stats)
+                for report_format, file_path in paths.items()
+            ]
+            for future in futures:
+                future.result()
 
     @staticmethod
     def _calculate_stats(results: List[DomainResult]) -> dict:
-        successful_results = [r for r in results if r.status_code and not r.error]
-        response_times = [r.response_time * 1000 for r in successful_results if r.response_time]
+        # Kept as one pure-Python pass: a NumPy version has to copy every field out of
+        # the result objects first, and that copy alone costs more than this loop.
+        # Splitting results into ok/errored lists up front was also measured slower.
+        successful = errors = https = http = redirects = 0
+        rt_count = 0
+        rt_sum = rt_max = 0.0
+        rt_min = float('inf')
+
+        for r in results:
+            if r.error:
+                errors += 1
+            elif r.status_code:
+                successful += 1
+                if r.response_time:
+                    ms = r.response_time * 1000
+                    rt_sum += ms
+                    rt_count += 1
+                    if ms < rt_min:
+                        rt_min = ms
+                    if ms > rt_max:
+                        rt_max = ms
+
+            protocol = r.protocol_used
+            if protocol == 'https':
+                https += 1
+            elif protocol == 'http':
+                http += 1
+
+            redirects += len(r.redirect_history)
 
         stats = {
-            'success_rate': (len(successful_results) / len(results) * 100) if results else 0,
-            'avg_response_time': sum(response_times) / len(response_times) if response_times else 0,
-            'min_response_time': min(response_times) if response_times else 0,
-            'max_response_time': max(response_times) if response_times else 0,
-            'error_count': len([r for r in results if r.error]),
-            'redirect_count': sum(len(r.redirect_history) for r in results),
-            'https_count': len([r for r in results if r.protocol_used == 'https']),
-            'http_count': len([r for r in results if r.protocol_used == 'http'])
+            'success_rate': (successful / len(results) * 100) if results else 0,
+            'avg_response_time': rt_sum / rt_count if rt_count else 0,
+            'min_response_time': rt_min if rt_count else 0,
+            'max_response_time': rt_max if rt_count else 0,
+            'error_count': errors,
+            'redirect_count': redirects,
+            'https_count': https,
+            'http_count': http
         }
 
         return stats
 
     @staticmethod
     def print_progress(current: int, total: int, result: DomainResult):
+        now = time.monotonic()
+        if current != total and now - Reporter._last_progress_time < PROGRESS_MIN_INTERVAL:
+            return
+        Reporter._last_progress_time = now
+
         percentage = (current / total) * 100
         status = f"[{result.status_code}]" if result.status_code else "[ERROR]"
         time_str = f"{result.response_time*1000:.0f}ms" if result.response_time else "N/A"
 
-        bar_length = 40
-        filled = int(bar_length * current / total)
-        bar = '█' * filled + '░' * (bar_length - filled)
+        filled = int(PROGRESS_BAR_LENGTH * current / total)
+        bar = PROGRESS_BAR_FULL[:filled] + PROGRESS_BAR_EMPTY[filled:]
 
         print(f'\r[{bar}] {percentage:.1f}% | {status} {result.domain} - {time_str}', end='', flush=True)
 